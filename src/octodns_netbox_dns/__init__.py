@@ -1,12 +1,293 @@
+import asyncio
+import concurrent.futures
+import dataclasses
+import functools
+import itertools
 import logging
+import operator
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any, Literal
 
 import dns.rdata
+import dns.rdataclass
+import dns.rdatatype
 import octodns.record
 import octodns.source.base
 import octodns.zone
 import pynetbox.core.api
 import pynetbox.core.response
+import requests.adapters
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None  # type: ignore[assignment]
+
+
+# how long a looked-up zone stays valid in the in-memory cache
+ZONE_CACHE_TTL = 300
+
+# page size for the records endpoint (netbox caps this at MAX_PAGE_SIZE)
+RECORDS_PAGE_SIZE = 1000
+
+# sentinel for record types that are fetched but not handed to octodns
+SKIP = object()
+
+# default location of the optional on-disk record cache
+DISK_CACHE_DIR = "~/.cache/octodns-netbox-dns"
+
+# record types whose value has to be decomposed with dnspython before
+# it can be handed to octodns; MX/SRV have a regular enough grammar to
+# split by hand and everything else passes through as-is
+NEEDS_RDATA = frozenset({"CAA", "LOC", "NAPTR", "SSHFP"})
+
+# resolve the rdata class/type enums once instead of per from_text call
+RDCLASS_IN = dns.rdataclass.IN
+RDTYPES = {rcd_type: dns.rdatatype.from_text(rcd_type) for rcd_type in NEEDS_RDATA}
+
+
+@dataclasses.dataclass(slots=True)
+class _RRSet:
+    """
+    Intermediate fixed-layout shape for one (name, type) group
+    """
+
+    name: str
+    rcd_type: str
+    ttl: int
+    value: Any = None
+    values: list[Any] | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class _CaaValue:
+    flags: int
+    tag: str
+    value: str
+
+
+@dataclasses.dataclass(slots=True)
+class _LocValue:
+    lat_direction: str
+    lat_degrees: int
+    lat_minutes: int
+    lat_seconds: float
+    long_direction: str
+    long_degrees: int
+    long_minutes: int
+    long_seconds: float
+    altitude: float
+    size: float
+    precision_horz: float
+    precision_vert: float
+
+
+@dataclasses.dataclass(slots=True)
+class _MxValue:
+    preference: int
+    exchange: str
+
+
+@dataclasses.dataclass(slots=True)
+class _NaptrValue:
+    order: int
+    preference: int
+    flags: str
+    service: str
+    regexp: str
+    replacement: str
+
+
+@dataclasses.dataclass(slots=True)
+class _SshfpValue:
+    algorithm: int
+    fingerprint_type: int
+    fingerprint: str
+
+
+@dataclasses.dataclass(slots=True)
+class _SrvValue:
+    priority: int
+    weight: int
+    port: int
+    target: str
+
+
+def _decode_json(resp: Any) -> Any:
+    """
+    Decode an api response body, with orjson when available
+
+    @param resp: the http response
+
+    @return: the decoded json payload
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+
+    return resp.json()
+
+
+@functools.lru_cache(maxsize=4096)
+def _absolutize(value: str, make_absolute: bool) -> str:
+    """
+    Return a dns name with a trailing dot, memoized for repeated targets
+
+    @param value: dns record value
+    @param make_absolute: whether relative names should be made absolute
+
+    @return: the (possibly) absolute dns record value
+    """
+    if not make_absolute or value.endswith("."):
+        return value
+
+    return value + "."
+
+
+def _resolve_value(rcd_value: str, zone_name: str) -> str:
+    """
+    Expand the "@" shorthand to the zone name
+
+    @param rcd_value: raw record value
+    @param zone_name: name of the containing zone
+
+    @return: the expanded record value
+    """
+    return zone_name if rcd_value == "@" else rcd_value
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_rdata(rcd_type: str, raw_value: str) -> dns.rdata.Rdata:
+    """
+    Parse a raw record value, memoized for values repeated across records
+
+    @param rcd_type: record type
+    @param raw_value: raw record value
+
+    @return: the parsed rdata
+    """
+    return dns.rdata.from_text(RDCLASS_IN, RDTYPES[rcd_type], raw_value)
+
+
+def _fmt_value(_source: "NetBoxDNSSource", _rdata: dns.rdata.Rdata | None, raw_value: str) -> str:
+    return raw_value
+
+
+def _fmt_cname(source: "NetBoxDNSSource", _rdata: dns.rdata.Rdata | None, raw_value: str) -> str:
+    return source._make_absolute(raw_value)
+
+
+def _fmt_txt(_source: "NetBoxDNSSource", _rdata: dns.rdata.Rdata | None, raw_value: str) -> str:
+    # most TXT values carry no semicolon to escape
+    return raw_value.replace(";", r"\;") if ";" in raw_value else raw_value
+
+
+def _fmt_caa(_source: "NetBoxDNSSource", rdata: dns.rdata.Rdata, _raw_value: str) -> _CaaValue:
+    return _CaaValue(
+        flags=rdata.flags,
+        tag=rdata.tag,
+        value=rdata.value,
+    )
+
+
+def _fmt_loc(_source: "NetBoxDNSSource", rdata: dns.rdata.Rdata, _raw_value: str) -> _LocValue:
+    return _LocValue(
+        lat_direction="N" if rdata.latitude[4] >= 0 else "S",
+        lat_degrees=rdata.latitude[0],
+        lat_minutes=rdata.latitude[1],
+        lat_seconds=rdata.latitude[2] + rdata.latitude[3] / 1000,
+        long_direction="W" if rdata.latitude[4] >= 0 else "E",
+        long_degrees=rdata.longitude[0],
+        long_minutes=rdata.longitude[1],
+        long_seconds=rdata.longitude[2] + rdata.longitude[3] / 1000,
+        altitude=rdata.altitude / 100,
+        size=rdata.size / 100,
+        precision_horz=rdata.horizontal_precision / 100,
+        precision_vert=rdata.veritical_precision / 100,
+    )
+
+
+def _fmt_mx(source: "NetBoxDNSSource", _rdata: dns.rdata.Rdata | None, raw_value: str) -> _MxValue:
+    preference, exchange = raw_value.split()
+    return _MxValue(
+        preference=int(preference),
+        exchange=source._make_absolute(exchange),
+    )
+
+
+def _fmt_naptr(_source: "NetBoxDNSSource", rdata: dns.rdata.Rdata, _raw_value: str) -> _NaptrValue:
+    return _NaptrValue(
+        order=rdata.order,
+        preference=rdata.preference,
+        flags=rdata.flags,
+        service=rdata.service,
+        regexp=rdata.regexp,
+        replacement=rdata.replacement.to_text(),
+    )
+
+
+def _fmt_sshfp(_source: "NetBoxDNSSource", rdata: dns.rdata.Rdata, _raw_value: str) -> _SshfpValue:
+    return _SshfpValue(
+        algorithm=rdata.algorithm,
+        fingerprint_type=rdata.fp_type,
+        fingerprint=rdata.fingerprint,
+    )
+
+
+def _fmt_srv(
+    source: "NetBoxDNSSource", _rdata: dns.rdata.Rdata | None, raw_value: str
+) -> _SrvValue:
+    priority, weight, port, target = raw_value.split()
+    return _SrvValue(
+        priority=int(priority),
+        weight=int(weight),
+        port=int(port),
+        target=source._make_absolute(target),
+    )
+
+
+def _fmt_soa(source: "NetBoxDNSSource", _rdata: dns.rdata.Rdata | None, _raw_value: str) -> Any:
+    source.log.debug("SOA record type not implemented")
+    return SKIP
+
+
+# O(1) record type dispatch instead of a linear match/case chain
+FORMATTERS: dict[str, Callable[["NetBoxDNSSource", Any, str], Any]] = {
+    "A": _fmt_value,
+    "AAAA": _fmt_value,
+    "CAA": _fmt_caa,
+    "CNAME": _fmt_cname,
+    "DNAME": _fmt_value,
+    "LOC": _fmt_loc,
+    "MX": _fmt_mx,
+    "NAPTR": _fmt_naptr,
+    "NS": _fmt_value,
+    "PTR": _fmt_value,
+    "SOA": _fmt_soa,
+    "SPF": _fmt_txt,
+    "SRV": _fmt_srv,
+    "SSHFP": _fmt_sshfp,
+    "TXT": _fmt_txt,
+}
 
 
 class NetBoxDNSSource(octodns.source.base.BaseSource):
@@ -16,36 +297,38 @@ class NetBoxDNSSource(octodns.source.base.BaseSource):
 
     SUPPORTS_GEO = False
     SUPPORTS_DYNAMIC = False
-    SUPPORTS: set[str] = {  # noqa
-        "A",
-        "AAAA",
-        "AFSDB",
-        "APL",
-        "CAA",
-        "CDNSKEY",
-        "CERT",
-        "CNAME",
-        "DCHID",
-        "DNAME",
-        "DNSKEY",
-        "DS",
-        "HIP",
-        "IPSECKEY",
-        "LOC",
-        "MX",
-        "NAPTR",
-        "NS",
-        "NSEC",
-        "PTR",
-        "RP",
-        "RRSIG",
-        "SOA",
-        "SPF",
-        "SRV",
-        "SSHFP",
-        "TLSA",
-        "TXT",
-    }
+    SUPPORTS: frozenset[str] = frozenset(
+        {
+            "A",
+            "AAAA",
+            "AFSDB",
+            "APL",
+            "CAA",
+            "CDNSKEY",
+            "CERT",
+            "CNAME",
+            "DCHID",
+            "DNAME",
+            "DNSKEY",
+            "DS",
+            "HIP",
+            "IPSECKEY",
+            "LOC",
+            "MX",
+            "NAPTR",
+            "NS",
+            "NSEC",
+            "PTR",
+            "RP",
+            "RRSIG",
+            "SOA",
+            "SPF",
+            "SRV",
+            "SSHFP",
+            "TLSA",
+            "TXT",
+        }
+    )
 
     def __init__(
         self,
@@ -56,19 +339,58 @@ class NetBoxDNSSource(octodns.source.base.BaseSource):
         ttl=3600,
         replace_duplicates=False,
         make_absolute=False,
+        cache_records=False,
+        disk_cache=False,
     ):
         """
         Initialize the NetboxDNSSource
         """
         self.log = logging.getLogger(f"NetboxDNSSource[{id}]")
+        self._debug_enabled = self.log.isEnabledFor(logging.DEBUG)
         self.log.debug(f"__init__: {id=}, {url=}, {view=}, {replace_duplicates=}, {make_absolute=}")
         super().__init__(id)
 
-        self.api = pynetbox.core.api.Api(url, token)
+        self.api = pynetbox.core.api.Api(url, token, threading=True)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=requests.adapters.Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self.api.http_session.mount("https://", adapter)
+        self.api.http_session.mount("http://", adapter)
+        self.api.http_session.headers.update(
+            {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+        )
+        self._zone_cache: dict[tuple[str, ...], tuple[float, pynetbox.core.response.Record]] = {}
+        self._prefetched: dict[str, list[dict[str, Any]]] = {}
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_lock = threading.Lock()
         self.nb_view = self._get_nb_view(view)
         self.ttl = ttl
         self.replace_duplicates = replace_duplicates
         self.make_absolute = make_absolute
+        # the configuration is constant for the source's lifetime, so the
+        # dispatch table is specialized once with the instance bound in
+        self._formatters: dict[str, Callable[[Any, str], Any]] = {
+            rcd_type: functools.partial(formatter, self)
+            for rcd_type, formatter in FORMATTERS.items()
+        }
+        self.cache_records = cache_records
+        self._records_by_zone: dict[int, list[dict[str, Any]]] | None = None
+        self._records_lock = threading.Lock()
+        self._zones_warmed = False
+
+        self.disk_cache = None
+        if disk_cache:
+            if diskcache is None:
+                msg = "disk_cache=true requires the diskcache package"
+                self.log.error(msg)
+                raise ValueError(msg)
+            cache_dir = os.path.expanduser(os.environ.get("OCTODNS_NB_CACHE", DISK_CACHE_DIR))
+            self.disk_cache = diskcache.Cache(cache_dir)
 
     def _make_absolute(self, value: str) -> str:
         """
@@ -78,11 +400,9 @@ class NetBoxDNSSource(octodns.source.base.BaseSource):
 
         @return: absolute dns record value
         """
-        if not self.make_absolute or value.endswith("."):
-            return value
-
-        absolute_value = value + "."
-        self.log.debug(f"relative={value}, absolute={absolute_value}")
+        absolute_value = _absolutize(value, self.make_absolute)
+        if self._debug_enabled and absolute_value != value:
+            self.log.debug("relative=%s, absolute=%s", value, absolute_value)
 
         return absolute_value
 
@@ -105,11 +425,13 @@ class NetBoxDNSSource(octodns.source.base.BaseSource):
             self.log.error(msg)
             raise ValueError(msg)
 
-        self.log.debug(f"found view={nb_view.name}, id={nb_view.id}")
+        self.log.debug("found view=%s, id=%s", nb_view.name, nb_view.id)
 
         return {"view_id": nb_view.id}
 
-    def _get_nb_zone(self, name: str, view: dict[str, str | int]) -> pynetbox.core.response.Record:
+    def _get_nb_zone(
+        self, name: str, view: dict[str, str | int]
+    ) -> pynetbox.core.response.Record | None:
         """
         Given a zone name and a view name, look it up in NetBox.
 
@@ -120,150 +442,420 @@ class NetBoxDNSSource(octodns.source.base.BaseSource):
 
         @return: the netbox dns zone object
         """
-        query_params = {"name": name[:-1], **view}
-        nb_zone = self.api.plugins.netbox_dns.zones.get(**query_params)
+        view_key = tuple(sorted(f"{k}={v}" for k, v in view.items()))
+
+        if self.cache_records and not self._zones_warmed:
+            # one listing warms the cache for every zone in the view
+            now = time.monotonic()
+            for warm_zone in self.api.plugins.netbox_dns.zones.filter(**view, limit=0):
+                self._zone_cache[(f"{warm_zone.name}.", *view_key)] = (now, warm_zone)
+            self._zones_warmed = True
+
+        cache_key = (name, *view_key)
+        cached = self._zone_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < ZONE_CACHE_TTL:
+            return cached[1]
+
+        # resolve the zone id via the brief serializer first: the full list
+        # serializer prefetches view/nameservers/tags/records and is slow
+        query_params = {"name": name[:-1], **view, "brief": "true"}
+        resp = self.api.http_session.get(
+            f"{self.api.base_url}/plugins/netbox-dns/zones/",
+            params=query_params,
+            headers={"Authorization": f"Token {self.api.token}"},
+        )
+        resp.raise_for_status()
+        results = _decode_json(resp)["results"]
+        if not results:
+            return None
+        if len(results) > 1:
+            # same semantics as pynetbox's .get(): an ambiguous name (e.g.
+            # the zone exists in several views) must not pick one at random
+            msg = f"zone={name}, found {len(results)} zones, specify a view"
+            self.log.error(msg)
+            raise ValueError(msg)
+
+        # brief lacks default_ttl/soa_refresh, so fetch the single zone by id
+        nb_zone = self.api.plugins.netbox_dns.zones.get(results[0]["id"])
 
-        self.log.debug(f"found zone={nb_zone.name}, id={nb_zone.id}")
+        self.log.debug("found zone=%s, id=%s", nb_zone.name, nb_zone.id)
+        self._zone_cache[cache_key] = (time.monotonic(), nb_zone)
 
         return nb_zone
 
-    def _format_rdata(self, rdata: dns.rdata.Rdata, raw_value: str) -> str | dict[str, Any]:
+    def _fetch_nb_records(self, nb_zone: pynetbox.core.response.Record) -> Iterator[dict[str, Any]]:
+        """
+        Fetch all active records of a zone as plain dicts
+
+        Bypasses pynetbox's Record wrappers: attribute access on them goes
+        through __getattr__ and may lazily re-fetch related objects over
+        HTTP per record (e.g. record.zone), which dominates populate time.
+        When ijson is installed the paginated responses are stream-parsed,
+        so records are yielded while the body is still downloading instead
+        of materializing the whole page first.
+
+        @param nb_zone: the netbox dns zone object
+
+        @return: an iterator of raw record dicts
+        """
+        session = self.api.http_session
+        headers = {"Authorization": f"Token {self.api.token}"}
+        url = f"{self.api.base_url}/plugins/netbox-dns/records/"
+        params: dict[str, Any] = {
+            "zone_id": nb_zone.id,
+            "status": "active",
+            "type__n": "SOA",
+            "ordering": "name,type",
+            "limit": RECORDS_PAGE_SIZE,
+        }
+
+        if ijson is None:
+            next_url: str | None = url
+            while next_url is not None:
+                resp = session.get(next_url, params=params, headers=headers)
+                resp.raise_for_status()
+                data = _decode_json(resp)
+                yield from data["results"]
+                # the "next" link already carries the query string
+                next_url = data["next"]
+                params = {}
+            return
+
+        offset = 0
+        page_size: int | None = None
+        while True:
+            resp = session.get(
+                url, params={**params, "offset": offset}, headers=headers, stream=True
+            )
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            page_len = 0
+            for nb_record in ijson.items(resp.raw, "results.item"):
+                page_len += 1
+                yield nb_record
+            if page_size is None:
+                # netbox may cap pages below the requested limit, so the
+                # effective page size is whatever the first page returned
+                page_size = page_len
+            if page_len < page_size or page_len == 0:
+                return
+            offset += page_len
+
+    def _warm_records_cache(self) -> dict[int, list[dict[str, Any]]]:
+        """
+        Fetch every record visible to the token once, indexed by zone id
+
+        Amortizes O(zones) filtered requests into one paginated listing
+        when many zones are synced from the same source instance.
+
+        @return: raw record dicts grouped by zone id
+        """
+        with self._records_lock:
+            if self._records_by_zone is None:
+                by_zone: dict[int, list[dict[str, Any]]] = {}
+                session = self.api.http_session
+                headers = {"Authorization": f"Token {self.api.token}"}
+                next_url: str | None = f"{self.api.base_url}/plugins/netbox-dns/records/"
+                params: dict[str, Any] = {
+                    "status": "active",
+                    "type__n": "SOA",
+                    "ordering": "name,type",
+                    "limit": RECORDS_PAGE_SIZE,
+                }
+                while next_url is not None:
+                    resp = session.get(next_url, params=params, headers=headers)
+                    resp.raise_for_status()
+                    data = _decode_json(resp)
+                    for nb_record in data["results"]:
+                        by_zone.setdefault(nb_record["zone"]["id"], []).append(nb_record)
+                    next_url = data["next"]
+                    params = {}
+                self._records_by_zone = by_zone
+
+        return self._records_by_zone
+
+    async def _afetch_nb_records(
+        self, client: "httpx.AsyncClient", nb_zone: pynetbox.core.response.Record
+    ) -> list[dict[str, Any]]:
+        """
+        Async variant of _fetch_nb_records with concurrent page fetches
+
+        Reads the result count off the first page, then issues all
+        remaining offset requests at once via asyncio.gather, so a zone
+        spanning N pages costs roughly one round trip instead of N.
+
+        @param client: the shared httpx client
+        @param nb_zone: the netbox dns zone object
+
+        @return: a list of raw record dicts
+        """
+        url = f"{self.api.base_url}/plugins/netbox-dns/records/"
+        params: dict[str, Any] = {
+            "zone_id": nb_zone.id,
+            "status": "active",
+            "type__n": "SOA",
+            "ordering": "name,type",
+            "limit": RECORDS_PAGE_SIZE,
+        }
+
+        first = await client.get(url, params=params)
+        first.raise_for_status()
+        data = _decode_json(first)
+        nb_records: list[dict[str, Any]] = data["results"]
+        count: int = data["count"]
+
+        # netbox may cap pages below the requested limit (MAX_PAGE_SIZE),
+        # so the effective page size is whatever the first page returned
+        page_size = len(nb_records)
+        if 0 < page_size < count:
+            pages = await asyncio.gather(
+                *(
+                    client.get(url, params={**params, "offset": offset})
+                    for offset in range(page_size, count, page_size)
+                )
+            )
+            for resp in pages:
+                resp.raise_for_status()
+                nb_records.extend(_decode_json(resp)["results"])
+
+        if len(nb_records) != count:
+            msg = f"zone_id={nb_zone.id}, expected {count} records, got {len(nb_records)}"
+            self.log.error(msg)
+            raise ValueError(msg)
+
+        return nb_records
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """
+        Return the cached httpx client, creating it on first use
+
+        Keeping one client per source amortizes the TLS handshakes and
+        mirrors the pool/retry tuning of the pynetbox session.
+
+        @return: the shared httpx client
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Token {self.api.token}",
+                    "Accept-Encoding": "gzip, deflate",
+                },
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                transport=httpx.AsyncHTTPTransport(retries=3),
+            )
+
+        return self._async_client
+
+    def _run_async(self, coro: Any) -> Any:
+        """
+        Run a coroutine on the source's private event loop
+
+        The cached httpx client is bound to the loop it first ran on, so
+        every async fetch has to run on the same loop instead of the
+        throwaway one asyncio.run would create per call. The lock keeps
+        concurrent populates (octodns runs them on a thread pool with
+        max_workers > 1) from entering the loop at the same time.
+
+        @param coro: the coroutine to run
+
+        @return: the coroutine's result
+        """
+        with self._async_lock:
+            if self._async_loop is None:
+                self._async_loop = asyncio.new_event_loop()
+
+            return self._async_loop.run_until_complete(coro)
+
+    async def _aprefetch(self, zones: list[octodns.zone.Zone]) -> None:
+        """
+        Fetch the records of several zones concurrently into the prefetch cache
+
+        @param zones: the octodns zones to prefetch
+        """
+        pending = [
+            (zone, self._get_nb_zone(zone.name, view=self.nb_view))
+            for zone in zones
+            if zone.name not in self._prefetched
+        ]
+        pending = [(zone, nb_zone) for zone, nb_zone in pending if nb_zone]
+
+        client = self._get_async_client()
+        results = await asyncio.gather(
+            *(self._afetch_nb_records(client, nb_zone) for _, nb_zone in pending)
+        )
+
+        for (zone, _), nb_records in zip(pending, results, strict=True):
+            self._prefetched[zone.name] = nb_records
+
+    def prefetch(self, zones: list[octodns.zone.Zone], max_workers: int = 8) -> None:
+        """
+        Warm the prefetch cache for several zones with a thread pool
+
+        Thread-based alternative to bulk_populate for callers that drive
+        populate themselves; the per-zone fetches are HTTP-bound, so they
+        scale with the pool until NetBox or the network saturates.
+
+        @param zones: the octodns zones to prefetch
+        @param max_workers: thread pool size
+        """
+        pending = [zone for zone in zones if zone.name not in self._prefetched]
+
+        def fetch(zone: octodns.zone.Zone) -> tuple[str, list[dict[str, Any]] | None]:
+            nb_zone = self._get_nb_zone(zone.name, view=self.nb_view)
+            if not nb_zone:
+                return zone.name, None
+            return zone.name, list(self._fetch_nb_records(nb_zone))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for name, nb_records in pool.map(fetch, pending):
+                if nb_records is not None:
+                    self._prefetched[name] = nb_records
+
+    def bulk_populate(
+        self, zones: list[octodns.zone.Zone], target: bool = False, lenient: bool = False
+    ) -> None:
+        """
+        Populate several zones at once, fetching their records concurrently
+
+        Falls back to plain sequential populate calls when httpx is not
+        installed.
+
+        @param zones: octodns zones
+        @param target: when `True`, load the current state of the provider.
+        @param lenient: when `True`, skip record validation and do a "best effort" load of data.
+        """
+        if httpx is not None:
+            self._run_async(self._aprefetch(zones))
+
+        for zone in zones:
+            self.populate(zone, target=target, lenient=lenient)
+
+    def _format_rdata(self, rcd_type: str, raw_value: str) -> Any:
         """
         Format netbox record values to correct octodns record values
 
-        @param rdata: rrdata record value
+        @param rcd_type: record type
         @param raw_value: raw record value
 
         @return: formatted rrdata value
         """
-        match rdata.rdtype.name:
-            case "A" | "AAAA":
-                value = rdata.address
-
-            case "CNAME":
-                value = self._make_absolute(rdata.target.to_text())
-
-            case "DNAME" | "NS" | "PTR":
-                value = rdata.target.to_text()
+        formatter = self._formatters.get(rcd_type)
+        if formatter is None:
+            msg = f"invalid record type={rcd_type}"
+            self.log.error(msg)
+            raise ValueError(msg)
 
-            case "CAA":
-                value = {
-                    "flags": rdata.flags,
-                    "tag": rdata.tag,
-                    "value": rdata.value,
-                }
+        rdata: dns.rdata.Rdata | None = None
+        if rcd_type in NEEDS_RDATA:
+            rdata = _parse_rdata(rcd_type, raw_value)
 
-            case "LOC":
-                value = {
-                    "lat_direction": "N" if rdata.latitude[4] >= 0 else "S",
-                    "lat_degrees": rdata.latitude[0],
-                    "lat_minutes": rdata.latitude[1],
-                    "lat_seconds": rdata.latitude[2] + rdata.latitude[3] / 1000,
-                    "long_direction": "W" if rdata.latitude[4] >= 0 else "E",
-                    "long_degrees": rdata.longitude[0],
-                    "long_minutes": rdata.longitude[1],
-                    "long_seconds": rdata.longitude[2] + rdata.longitude[3] / 1000,
-                    "altitude": rdata.altitude / 100,
-                    "size": rdata.size / 100,
-                    "precision_horz": rdata.horizontal_precision / 100,
-                    "precision_vert": rdata.veritical_precision / 100,
-                }
+        value = formatter(rdata, raw_value)
 
-            case "MX":
-                value = {
-                    "preference": rdata.preference,
-                    "exchange": self._make_absolute(rdata.exchange.to_text()),
-                }
+        if self._debug_enabled:
+            self.log.debug("formatted record value=%s", value)
 
-            case "NAPTR":
-                value = {
-                    "order": rdata.order,
-                    "preference": rdata.preference,
-                    "flags": rdata.flags,
-                    "service": rdata.service,
-                    "regexp": rdata.regexp,
-                    "replacement": rdata.replacement.to_text(),
-                }
+        return value
 
-            case "SSHFP":
-                value = {
-                    "algorithm": rdata.algorithm,
-                    "fingerprint_type": rdata.fp_type,
-                    "fingerprint": rdata.fingerprint,
-                }
+    def _shape_nb_records(
+        self, nb_records: Iterable[dict[str, Any]], nb_zone: pynetbox.core.response.Record
+    ) -> Iterator[_RRSet]:
+        """
+        Group raw record dicts into octodns compatible rrsets
 
-            case "SPF" | "TXT":
-                value = raw_value.replace(";", r"\;")
+        The records endpoint is asked for ordering=name,type, so each
+        (name, type) group is contiguous and can be emitted as soon as it
+        is complete — peak memory is one RRset instead of the whole zone.
 
-            case "SRV":
-                value = {
-                    "priority": rdata.priority,
-                    "weight": rdata.weight,
-                    "port": rdata.port,
-                    "target": self._make_absolute(rdata.target.to_text()),
-                }
+        @param nb_records: raw record dicts, ordered by name and type
+        @param nb_zone: the netbox dns zone object
 
-            case "SOA":
-                self.log.debug("SOA record type not implemented")
-                raise NotImplementedError
+        @return: an iterator of octodns compatible rrsets
+        """
+        # hoist per-zone constants and bound methods out of the hot loop
+        zone_name: str = nb_zone.name
+        default_ttl: int = nb_zone.default_ttl
+        soa_refresh: int = nb_zone.soa_refresh
+        format_rdata = self._format_rdata
+        log_debug = self.log.debug
+        debug_enabled = self._debug_enabled
+
+        group_key = operator.itemgetter("name", "type")
+        for (raw_name, raw_type), group in itertools.groupby(nb_records, key=group_key):
+            # names and types repeat heavily within a zone; interning them
+            # turns the grouping keys into pointer comparisons
+            rcd_name: str = sys.intern(raw_name) if raw_name != "@" else ""
+            rcd_type: str = sys.intern(raw_type)
+
+            rcd_ttl: int | None = None
+            values: list[Any] = []
+            for nb_record in group:
+                raw_value = _resolve_value(nb_record["value"], zone_name)
+                if rcd_ttl is None:
+                    rcd_ttl = nb_record["ttl"] or default_ttl
+                rcd_value = format_rdata(rcd_type, raw_value)
+                if rcd_value is not SKIP:
+                    values.append(rcd_value)
+
+            if not values:
+                continue
+            if rcd_type == "NS":
+                rcd_ttl = soa_refresh
+            if dataclasses.is_dataclass(values[0]):
+                # structured values stay slotted until octodns needs dicts
+                values = [dataclasses.asdict(value) for value in values]
 
-            case _:
-                self.log.error("invalid record type")
-                raise ValueError
+            if len(values) == 1:
+                rrset = _RRSet(name=rcd_name, rcd_type=rcd_type, ttl=rcd_ttl, value=values[0])
+            else:
+                rrset = _RRSet(name=rcd_name, rcd_type=rcd_type, ttl=rcd_ttl, values=values)
 
-        self.log.debug(f"formatted record value={value}")
+            if debug_enabled:
+                log_debug("record data=%s", rrset)
 
-        return value  # type:ignore
+            yield rrset
 
-    def _format_nb_records(self, zone: octodns.zone.Zone) -> list[dict[str, Any]]:
+    def _format_nb_records(self, zone: octodns.zone.Zone) -> Iterator[_RRSet]:
         """
         Format netbox dns records to the octodns format
 
         @param zone: octodns zone
 
-        @return: a list of octodns compatible record dicts
+        @return: an iterator of octodns compatible rrsets
         """
-        records: dict[tuple[str, str], dict[str, Any]] = {}
-
         nb_zone = self._get_nb_zone(zone.name, view=self.nb_view)
         if not nb_zone:
             self.log.error(f"zone={zone.name}, not found in view={self.nb_view}")
             raise LookupError
 
-        nb_records: pynetbox.core.response.RecordSet = self.api.plugins.netbox_dns.records.filter(
-            zone_id=nb_zone.id, status="active"
-        )
-        for nb_record in nb_records:
-            rcd_name: str = nb_record.name if nb_record.name != "@" else ""
-            raw_value: str = nb_record.value if nb_record.value != "@" else nb_record.zone.name
-            rcd_type: str = nb_record.type
-            rcd_ttl: int = nb_record.ttl or nb_zone.default_ttl
-            if nb_record.type == "NS":
-                rcd_ttl = nb_zone.soa_refresh
-
-            rcd_data = {
-                "name": rcd_name,
-                "type": rcd_type,
-                "ttl": rcd_ttl,
-                "values": [],
-            }
-
-            self.log.debug(f"record data={rcd_data}")
-
-            rdata = dns.rdata.from_text("IN", nb_record.type, raw_value)
-            try:
-                rcd_value = self._format_rdata(rdata, raw_value)
-            except NotImplementedError:
-                continue
-            except Exception as exc:
-                raise exc
-
-            if (rcd_name, rcd_type) not in records:
-                records[(rcd_name, rcd_type)] = rcd_data
-
-            records[(rcd_name, rcd_type)]["values"].append(rcd_value)
-
-        return list(records.values())
+        disk_key = None
+        if self.disk_cache is not None:
+            # the zone's last_updated moves on any record change, so it
+            # doubles as the invalidation token for repeated runs
+            disk_key = f"{nb_zone.id}:{nb_zone.last_updated}"
+            cached = self.disk_cache.get(disk_key)
+            if cached is not None:
+                self.log.debug("disk cache hit for zone=%s", zone.name)
+                yield from cached
+                return
+
+        nb_records: Any = self._prefetched.pop(zone.name, None)
+        if nb_records is None and self.cache_records:
+            nb_records = self._warm_records_cache().get(nb_zone.id, [])
+        if nb_records is None:
+            if httpx is not None:
+                nb_records = self._run_async(
+                    self._afetch_nb_records(self._get_async_client(), nb_zone)
+                )
+            else:
+                nb_records = self._fetch_nb_records(nb_zone)
+
+        if disk_key is not None:
+            formatted = list(self._shape_nb_records(nb_records, nb_zone))
+            self.disk_cache[disk_key] = formatted
+            yield from formatted
+            return
+
+        yield from self._shape_nb_records(nb_records, nb_zone)
 
     def populate(
         self, zone: octodns.zone.Zone, target: bool = False, lenient: bool = False
@@ -277,17 +869,24 @@ class NetBoxDNSSource(octodns.source.base.BaseSource):
         """
         self.log.info(f"populate -> '{zone.name}', target={target}, lenient={lenient}")
 
-        records = self._format_nb_records(zone)
-        for data in records:
-            if len(data["values"]) == 1:
-                data["value"] = data.pop("values")[0]
-            record = octodns.record.Record.new(
+        # hoist the per-rrset attribute lookups out of the loop
+        record_new = octodns.record.Record.new
+        add_record = zone.add_record
+        replace = self.replace_duplicates
+
+        for rrset in self._format_nb_records(zone):
+            data: dict[str, Any] = {"type": rrset.rcd_type, "ttl": rrset.ttl}
+            if rrset.values is not None:
+                data["values"] = rrset.values
+            else:
+                data["value"] = rrset.value
+            record = record_new(
                 zone=zone,
-                name=data["name"],
+                name=rrset.name,
                 data=data,
                 source=self,
                 lenient=lenient,
             )
-            zone.add_record(record, lenient=lenient, replace=self.replace_duplicates)
+            add_record(record, lenient=lenient, replace=replace)
 
         self.log.info(f"populate -> found {len(zone.records)} records for zone '{zone.name}'")